@@ -1,5 +1,6 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from . import models
 
@@ -14,7 +15,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     await models.close_db()
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 app.include_router(routers.router)
 
 @app.get("/")
@@ -11,7 +11,7 @@ class DeliveryStaffBase(SQLModel):
     email: str = Field(unique=True, index=True)
     phone: str
     employee_id: str = Field(unique=True, index=True)
-    is_active: bool = Field(default=True)
+    is_active: bool = Field(default=True, index=True)
 
 
 class DeliveryStaff(DeliveryStaffBase, table=True):
@@ -7,10 +7,20 @@ from ..schemas import receiver_schema
 
 if TYPE_CHECKING:
     from .parcel_model import Parcel
+    from .item_model import Item
 
 class Receiver(SQLModel, receiver_schema.ReceiverBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
+    email: str = Field(unique=True, index=True)
+    is_active: bool = Field(default=True, index=True)
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
-    parcels: List["Parcel"] = Relationship(back_populates="receiver")
\ No newline at end of file
+    # Collections are loaded with one SELECT ... IN per query instead of one
+    # lazy SELECT per receiver
+    parcels: List["Parcel"] = Relationship(
+        back_populates="receiver", sa_relationship_kwargs={"lazy": "selectin"}
+    )
+    items: List["Item"] = Relationship(
+        back_populates="receiver", sa_relationship_kwargs={"lazy": "selectin"}
+    )
\ No newline at end of file
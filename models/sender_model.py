@@ -8,10 +8,10 @@ if TYPE_CHECKING:
 
 class SenderBase(SQLModel):
     name: str = Field(index=True)
-    email: str = Field(index=True)
+    email: str = Field(unique=True, index=True)
     phone: Optional[str] = None
     address: Optional[str] = None
-    is_active: bool = Field(default=True)
+    is_active: bool = Field(default=True, index=True)
 
 
 class Sender(SenderBase, table=True):
@@ -14,7 +14,7 @@ class StationBase(SQLModel):
     state: str = Field(index=True)
     postal_code: str
     phone: Optional[str] = None
-    is_active: bool = Field(default=True)
+    is_active: bool = Field(default=True, index=True)
 
 
 class Station(StationBase, table=True):
@@ -10,7 +10,7 @@ class VehicleBase(SQLModel):
     license_plate: str = Field(unique=True, index=True)
     type: str = Field(index=True)  # truck, van, motorcycle, etc.
     capacity: float  # in kg
-    is_active: bool = Field(default=True)
+    is_active: bool = Field(default=True, index=True)
 
 
 class Vehicle(VehicleBase, table=True):
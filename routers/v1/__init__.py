@@ -1,19 +1,19 @@
 from fastapi import APIRouter
 from . import (
-    item_router,
-    receiver_router,
-    sender_router,
-    station_router,
-    vehicle_router,
-    delivery_staff_router,
+    items_router,
+    receivers_router,
+    senders_router,
+    stations_router,
+    vehicles_router,
+    delivery_staffs_router,
     parcel_router,
 )
 
 router = APIRouter(prefix="/v1")
-router.include_router(item_router.router)
-router.include_router(receiver_router.router)
-router.include_router(sender_router.router)
-router.include_router(station_router.router)
-router.include_router(vehicle_router.router)
-router.include_router(delivery_staff_router.router)
+router.include_router(items_router.router)
+router.include_router(receivers_router.router)
+router.include_router(senders_router.router)
+router.include_router(stations_router.router)
+router.include_router(vehicles_router.router)
+router.include_router(delivery_staffs_router.router)
 router.include_router(parcel_router.router)
\ No newline at end of file
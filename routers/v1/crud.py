@@ -0,0 +1,159 @@
+from typing import Annotated, Mapping, Optional
+
+from fastapi import APIRouter, HTTPException, Depends, Path, Response
+from pydantic import BaseModel
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from ...models import get_session
+from .responses import json_response, schema_columns
+from .writes import commit_or_raise, delete_referenced, now
+
+
+def make_crud_router(
+    *,
+    prefix: str,
+    tag: str,
+    label: str,
+    id_param: str,
+    model: type[SQLModel],
+    create_schema: type[BaseModel],
+    update_schema: type[BaseModel],
+    read_schema: type[BaseModel],
+    unique_errors: dict[str, str],
+    get_name: Optional[str] = None,
+    route_docs: Optional[Mapping[str, tuple[str, str]]] = None,
+) -> APIRouter:
+    """Build a router with get/create/update/delete routes for ``model``.
+
+    ``id_param`` names the primary key in the path, ``get_name`` overrides
+    the get route's name and ``route_docs`` maps "get", "create", "update"
+    or "delete" to a (summary, description) pair replacing the generated
+    text, so paths, operation IDs and docs stay as they were before the
+    routers shared this code. ``unique_errors`` maps each unique
+    column to the 400 detail returned when a write collides with it.
+    Module-specific routes (list filters, lookups by natural key) are added
+    to the returned router by the caller.
+    """
+    router = APIRouter(prefix=prefix, tags=[tag])
+    not_found = f"{label[0].upper()}{label[1:]} not found"
+    route_name = label.replace(" ", "_")
+    columns = schema_columns(model, read_schema)
+    object_path = f"/{{{id_param}}}"
+    ObjectId = Annotated[int, Path(alias=id_param)]
+    docs = {
+        "get": (
+            f"Get a {label} by ID",
+            f"Retrieve a specific {label} using its unique identifier.",
+        ),
+        "create": (
+            f"Create a new {label}",
+            f"Create a new {label} with the provided details.",
+        ),
+        "update": (
+            f"Update an existing {label}",
+            f"Update an existing {label} with the provided details.",
+        ),
+        "delete": (f"Delete a {label}", f"Delete a {label} by ID."),
+        **(route_docs or {}),
+    }
+
+    async def fetch_object(session: AsyncSession, object_id: int):
+        db_object = await session.get(model, object_id)
+        if not db_object:
+            raise HTTPException(status_code=404, detail=not_found)
+        return db_object
+
+    async def get_object(
+        object_id: ObjectId,
+        session: AsyncSession = Depends(get_session),
+    ) -> Response:
+        """Get a single object by ID."""
+        result = await session.exec(select(*columns).where(model.id == object_id))
+        row = result.first()
+        if not row:
+            raise HTTPException(status_code=404, detail=not_found)
+
+        return json_response(read_schema, row)
+
+    async def create_object(
+        payload: create_schema, session: AsyncSession = Depends(get_session)
+    ) -> SQLModel:
+        """Create a new object."""
+        # Stamp both timestamps from one clock read
+        timestamp = now()
+        db_object = model(
+            **payload.model_dump(), created_at=timestamp, updated_at=timestamp
+        )
+        session.add(db_object)
+        await commit_or_raise(session, model, unique_errors)
+
+        return db_object
+
+    async def update_object(
+        object_id: ObjectId,
+        payload: update_schema,
+        session: AsyncSession = Depends(get_session),
+    ) -> SQLModel:
+        """Update an existing object."""
+        db_object = await fetch_object(session, object_id)
+
+        # Update only provided fields
+        update_data = payload.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(db_object, field, value)
+
+        # Update timestamp
+        db_object.updated_at = now()
+
+        await commit_or_raise(session, model, unique_errors)
+
+        return db_object
+
+    async def delete_object(
+        object_id: ObjectId,
+        session: AsyncSession = Depends(get_session),
+    ):
+        """Delete an object."""
+        await delete_referenced(session, model, object_id, not_found)
+        return None
+
+    router.add_api_route(
+        object_path,
+        get_object,
+        methods=["GET"],
+        name=get_name or f"get_{route_name}",
+        summary=docs["get"][0],
+        description=docs["get"][1],
+        response_model=read_schema,
+    )
+    router.add_api_route(
+        "",
+        create_object,
+        methods=["POST"],
+        name=f"create_{route_name}",
+        summary=docs["create"][0],
+        description=docs["create"][1],
+        response_model=read_schema,
+        status_code=201,
+    )
+    router.add_api_route(
+        object_path,
+        update_object,
+        methods=["PUT"],
+        name=f"update_{route_name}",
+        summary=docs["update"][0],
+        description=docs["update"][1],
+        response_model=read_schema,
+    )
+    router.add_api_route(
+        object_path,
+        delete_object,
+        methods=["DELETE"],
+        name=f"delete_{route_name}",
+        summary=docs["delete"][0],
+        description=docs["delete"][1],
+        status_code=204,
+    )
+
+    return router
@@ -1,5 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
-from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from sqlmodel import select
 
@@ -8,6 +7,8 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ...schemas import item_schema
 from ...models import get_session, Item
+from .responses import MAX_PAGE_SIZE
+from .writes import commit_or_raise, delete_or_raise, now
 
 router = APIRouter(prefix="/items", tags=["items"])
 
@@ -20,12 +21,12 @@ router = APIRouter(prefix="/items", tags=["items"])
 )
 async def read_item(
     item_id: int, session: AsyncSession = Depends(get_session)
-) -> item_schema.Item:
+) -> Item:
     """Get a single item by ID."""
     db_item = await session.get(Item, item_id)
     if not db_item:
         raise HTTPException(status_code=404, detail="Item not found")
-    return item_schema.Item.model_validate(db_item)
+    return db_item
 
 
 @router.get(
@@ -36,15 +37,21 @@ async def read_item(
 )
 
 async def read_items(
-    page: int = 1,
-    size_per_page: int = 50,
+    page: int = Query(1, ge=1),
+    size_per_page: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
     session: AsyncSession = Depends(get_session),
-) -> list[item_schema.Item]:
+) -> list[Item]:
     """Get all items with pagination."""
-    query = select(Item).offset((page - 1) * size_per_page).limit(size_per_page)
+    # Paginate in primary key order so pages are stable
+    query = (
+        select(Item)
+        .order_by(Item.id)
+        .offset((page - 1) * size_per_page)
+        .limit(size_per_page)
+    )
     result = await session.exec(query)
     db_items = result.all()
-    return [item_schema.Item.model_validate(item) for item in db_items]
+    return db_items
 
 
 @router.post(
@@ -56,13 +63,14 @@ async def read_items(
 )
 async def create_item(
     item: item_schema.ItemCreate, session: AsyncSession = Depends(get_session)
-) -> item_schema.Item:
+) -> Item:
     """Create a new item."""
-    db_item = Item(**item.model_dump())
+    timestamp = now()
+    db_item = Item(**item.model_dump(), created_at=timestamp, updated_at=timestamp)
     session.add(db_item)
-    await session.commit()
+    await commit_or_raise(session, Item)
     await session.refresh(db_item)
-    return item_schema.Item.model_validate(db_item)
+    return db_item
 
 
 @router.put(
@@ -75,7 +83,7 @@ async def update_item(
     item_id: int,
     item_update: item_schema.ItemUpdate,
     session: AsyncSession = Depends(get_session),
-) -> item_schema.Item:
+) -> Item:
     """Update an existing item."""
     db_item = await session.get(Item, item_id)
     if not db_item:
@@ -88,11 +96,11 @@ async def update_item(
 
     # Update timestamp
 
-    db_item.updated_at = datetime.now()
+    db_item.updated_at = now()
 
-    await session.commit()
+    await commit_or_raise(session, Item)
     await session.refresh(db_item)
-    return item_schema.Item.model_validate(db_item)
+    return db_item
 
 
 @router.delete(
@@ -104,10 +112,5 @@ async def update_item(
 
 async def delete_item(item_id: int, session: AsyncSession = Depends(get_session)):
     """Delete an item."""
-    db_item = await session.get(Item, item_id)
-    if not db_item:
-        raise HTTPException(status_code=404, detail="Item not found")
-
-    await session.delete(db_item)
-    await session.commit()
+    await delete_or_raise(session, Item, item_id, "Item not found")
     return None
\ No newline at end of file
@@ -1,21 +1,34 @@
 from typing import Optional
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from datetime import datetime
 import random
 import string
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from schemas import parcel_schema
-from models import get_session, Parcel, Station
+from ...schemas import parcel_schema
+from ...models import get_session, Parcel, Station
+from .responses import MAX_PAGE_SIZE
+from .writes import (
+    commit_or_raise,
+    delete_or_raise,
+    now,
+    raise_for_constraint,
+    unique_violation,
+)
 
 router = APIRouter(prefix="/parcels", tags=["parcels"])
 
+# Tracking number collisions are retried this many times before giving up
+TRACKING_NUMBER_ATTEMPTS = 5
+
 
-def generate_tracking_number() -> str:
-    """Generate a unique tracking number."""
+def generate_tracking_number(created_at: datetime) -> str:
+    """Generate a unique tracking number for a parcel created at ``created_at``."""
     prefix = "PKG"
-    timestamp = datetime.now().strftime("%Y%m%d")
+    timestamp = created_at.strftime("%Y%m%d")
     random_suffix = "".join(random.choices(string.ascii_uppercase + string.digits, k=6))
     return f"{prefix}{timestamp}{random_suffix}"
 
@@ -27,13 +40,13 @@ def generate_tracking_number() -> str:
     response_model=list[parcel_schema.Parcel],
 )
 async def get_parcels(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
     status: Optional[parcel_schema.ParcelStatus] = None,
     sender_id: Optional[int] = None,
     receiver_id: Optional[int] = None,
     session: AsyncSession = Depends(get_session),
-) -> list[parcel_schema.Parcel]:
+) -> list[Parcel]:
     """Get all parcels with optional pagination and filtering."""
     query = select(Parcel)
 
@@ -45,13 +58,13 @@ async def get_parcels(
     if receiver_id:
         query = query.where(Parcel.receiver_id == receiver_id)
 
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
+    # Apply pagination in primary key order so pages are stable
+    query = query.order_by(Parcel.id).offset(skip).limit(limit)
 
     result = await session.exec(query)
     parcels = result.all()
 
-    return [parcel_schema.Parcel.model_validate(parcel) for parcel in parcels]
+    return parcels
 
 
 @router.get(
@@ -62,13 +75,13 @@ async def get_parcels(
 )
 async def get_parcel(
     parcel_id: int, session: AsyncSession = Depends(get_session)
-) -> parcel_schema.Parcel:
+) -> Parcel:
     """Get a single parcel by ID."""
     parcel = await session.get(Parcel, parcel_id)
     if not parcel:
         raise HTTPException(status_code=404, detail="Parcel not found")
 
-    return parcel_schema.Parcel.model_validate(parcel)
+    return parcel
 
 
 @router.get(
@@ -81,13 +94,16 @@ async def track_parcel(
     tracking_number: str, session: AsyncSession = Depends(get_session)
 ) -> parcel_schema.ParcelTracking:
     """Track a parcel by tracking number."""
+    # Resolve both station names in the same query as the parcel
+    origin_station = aliased(Station)
+    destination_station = aliased(Station)
     query = (
-        select(
-            Parcel,
-            Station.name.label("origin_station_name"),
-            Station.name.label("destination_station_name"),
+        select(Parcel, origin_station.name, destination_station.name)
+        .outerjoin(origin_station, Parcel.origin_station_id == origin_station.id)
+        .outerjoin(
+            destination_station,
+            Parcel.destination_station_id == destination_station.id,
         )
-        .outerjoin(Station, Parcel.origin_station_id == Station.id)
         .where(Parcel.tracking_number == tracking_number)
     )
     result = await session.exec(query)
@@ -96,21 +112,7 @@ async def track_parcel(
     if not parcel_data:
         raise HTTPException(status_code=404, detail="Parcel not found")
 
-    parcel = parcel_data[0]
-
-    # Get station names separately for better handling
-    origin_station_name = None
-    destination_station_name = None
-
-    if parcel.origin_station_id:
-        origin_station = await session.get(Station, parcel.origin_station_id)
-        origin_station_name = origin_station.name if origin_station else None
-
-    if parcel.destination_station_id:
-        destination_station = await session.get(Station, parcel.destination_station_id)
-        destination_station_name = (
-            destination_station.name if destination_station else None
-        )
+    parcel, origin_station_name, destination_station_name = parcel_data
 
     return parcel_schema.ParcelTracking(
         tracking_number=parcel.tracking_number,
@@ -132,31 +134,33 @@ async def track_parcel(
 async def create_parcel(
     parcel: parcel_schema.ParcelCreate,
     session: AsyncSession = Depends(get_session),
-) -> parcel_schema.Parcel:
+) -> Parcel:
     """Create a new parcel."""
-    # Generate unique tracking number
-    tracking_number = generate_tracking_number()
-
-    # Ensure tracking number is unique
-    while True:
-        query = select(Parcel).where(Parcel.tracking_number == tracking_number)
-        result = await session.exec(query)
-        existing_parcel = result.first()
+    # One clock read stamps the parcel and dates its tracking number
+    timestamp = now()
+    parcel_data = parcel.model_dump()
+    parcel_data["created_at"] = parcel_data["updated_at"] = timestamp
 
-        if not existing_parcel:
-            break
-        tracking_number = generate_tracking_number()
+    # Let the unique index on tracking_number arbitrate between concurrent
+    # creates instead of checking first and inserting later
+    for _ in range(TRACKING_NUMBER_ATTEMPTS):
+        parcel_data["tracking_number"] = generate_tracking_number(timestamp)
 
-    # Create new parcel
-    parcel_data = parcel.model_dump()
-    parcel_data["tracking_number"] = tracking_number
+        db_parcel = Parcel(**parcel_data)
+        session.add(db_parcel)
+        try:
+            await session.commit()
+        except IntegrityError as exc:
+            await session.rollback()
+            if str(exc.orig) == unique_violation(Parcel, "tracking_number"):
+                continue
+            raise_for_constraint(exc, Parcel)
+            raise
 
-    db_parcel = Parcel(**parcel_data)
-    session.add(db_parcel)
-    await session.commit()
-    await session.refresh(db_parcel)
+        await session.refresh(db_parcel)
+        return db_parcel
 
-    return parcel_schema.Parcel.model_validate(db_parcel)
+    raise HTTPException(status_code=503, detail="Could not allocate a tracking number")
 
 
 @router.put(
@@ -169,7 +173,7 @@ async def update_parcel(
     parcel_id: int,
     parcel_update: parcel_schema.ParcelUpdate,
     session: AsyncSession = Depends(get_session),
-) -> parcel_schema.Parcel:
+) -> Parcel:
     """Update an existing parcel."""
     db_parcel = await session.get(Parcel, parcel_id)
     if not db_parcel:
@@ -181,12 +185,12 @@ async def update_parcel(
         setattr(db_parcel, field, value)
 
     # Update timestamp
-    db_parcel.updated_at = datetime.now()
+    db_parcel.updated_at = now()
 
-    await session.commit()
+    await commit_or_raise(session, Parcel)
     await session.refresh(db_parcel)
 
-    return parcel_schema.Parcel.model_validate(db_parcel)
+    return db_parcel
 
 
 @router.patch(
@@ -199,19 +203,19 @@ async def update_parcel_status(
     parcel_id: int,
     status: parcel_schema.ParcelStatus,
     session: AsyncSession = Depends(get_session),
-) -> parcel_schema.Parcel:
+) -> Parcel:
     """Update parcel status."""
     db_parcel = await session.get(Parcel, parcel_id)
     if not db_parcel:
         raise HTTPException(status_code=404, detail="Parcel not found")
 
     db_parcel.status = status
-    db_parcel.updated_at = datetime.now()
+    db_parcel.updated_at = now()
 
-    await session.commit()
+    await commit_or_raise(session, Parcel)
     await session.refresh(db_parcel)
 
-    return parcel_schema.Parcel.model_validate(db_parcel)
+    return db_parcel
 
 
 @router.patch(
@@ -224,19 +228,19 @@ async def assign_vehicle_to_parcel(
     parcel_id: int,
     vehicle_id: int,
     session: AsyncSession = Depends(get_session),
-) -> parcel_schema.Parcel:
+) -> Parcel:
     """Assign a vehicle to a parcel."""
     db_parcel = await session.get(Parcel, parcel_id)
     if not db_parcel:
         raise HTTPException(status_code=404, detail="Parcel not found")
 
     db_parcel.vehicle_id = vehicle_id
-    db_parcel.updated_at = datetime.now()
+    db_parcel.updated_at = now()
 
-    await session.commit()
+    await commit_or_raise(session, Parcel)
     await session.refresh(db_parcel)
 
-    return parcel_schema.Parcel.model_validate(db_parcel)
+    return db_parcel
 
 
 @router.patch(
@@ -249,19 +253,19 @@ async def assign_delivery_staff_to_parcel(
     parcel_id: int,
     delivery_staff_id: int,
     session: AsyncSession = Depends(get_session),
-) -> parcel_schema.Parcel:
+) -> Parcel:
     """Assign delivery staff to a parcel."""
     db_parcel = await session.get(Parcel, parcel_id)
     if not db_parcel:
         raise HTTPException(status_code=404, detail="Parcel not found")
 
     db_parcel.delivery_staff_id = delivery_staff_id
-    db_parcel.updated_at = datetime.now()
+    db_parcel.updated_at = now()
 
-    await session.commit()
+    await commit_or_raise(session, Parcel)
     await session.refresh(db_parcel)
 
-    return parcel_schema.Parcel.model_validate(db_parcel)
+    return db_parcel
 
 
 @router.delete(
@@ -272,10 +276,5 @@ async def assign_delivery_staff_to_parcel(
 )
 async def delete_parcel(parcel_id: int, session: AsyncSession = Depends(get_session)):
     """Delete a parcel."""
-    db_parcel = await session.get(Parcel, parcel_id)
-    if not db_parcel:
-        raise HTTPException(status_code=404, detail="Parcel not found")
-
-    await session.delete(db_parcel)
-    await session.commit()
+    await delete_or_raise(session, Parcel, parcel_id, "Parcel not found")
     return None
\ No newline at end of file
@@ -1,14 +1,26 @@
 from typing import Optional
-from fastapi import APIRouter, HTTPException, Depends
-from datetime import datetime
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from sqlalchemy.orm import raiseload
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from schemas import receiver_schema
-from models import get_session, Receiver
+from ...schemas import receiver_schema
+from ...models import get_session, Receiver
+from .responses import MAX_PAGE_SIZE, json_list_response, json_response, schema_columns
+from .writes import commit_or_raise, delete_referenced, now
 
 router = APIRouter(prefix="/receivers", tags=["receivers"])
 
+# Read endpoints select these columns and get plain rows back
+RECEIVER_COLUMNS = schema_columns(Receiver, receiver_schema.Receiver)
+
+# Receiver responses never include parcels or items, so writes that load
+# the entity skip their eager load and fail loudly if something touches them
+SKIP_RELATIONSHIPS = [raiseload("*")]
+
+# 400 detail for a write that collides with each unique column
+RECEIVER_UNIQUE_ERRORS = {"email": "Email already registered"}
+
 
 
 @router.get(
@@ -18,26 +30,26 @@ router = APIRouter(prefix="/receivers", tags=["receivers"])
     response_model=list[receiver_schema.Receiver],
 )
 async def get_receivers(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
     is_active: Optional[bool] = None,
     session: AsyncSession = Depends(get_session),
-) -> list[receiver_schema.Receiver]:
+) -> Response:
     """Get all receivers with optional pagination and filtering."""
-    query = select(Receiver)
+    query = select(*RECEIVER_COLUMNS)
 
 
     # Filter by is_active if provided
     if is_active is not None:
         query = query.where(Receiver.is_active == is_active)
 
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
+    # Apply pagination in primary key order so pages are stable
+    query = query.order_by(Receiver.id).offset(skip).limit(limit)
 
     result = await session.exec(query)
     receivers = result.all()    
 
-    return [receiver_schema.Receiver.model_validate(receiver) for receiver in receivers]
+    return json_list_response(receiver_schema.Receiver, receivers)
 
 
 @router.get(
@@ -48,12 +60,15 @@ async def get_receivers(
 )
 async def get_receiver(
     receiver_id: int, session: AsyncSession = Depends(get_session)
-) -> receiver_schema.Receiver:
+) -> Response:
     """Get a single receiver by ID."""
-    receiver = await session.get(Receiver, receiver_id)
+    query = select(*RECEIVER_COLUMNS).where(Receiver.id == receiver_id)
+    result = await session.exec(query)
+    receiver = result.first()
+
     if not receiver:
         raise HTTPException(status_code=404, detail="Receiver not found")
-    return receiver_schema.Receiver.model_validate(receiver)
+    return json_response(receiver_schema.Receiver, receiver)
 
 
 @router.post(
@@ -66,24 +81,19 @@ async def get_receiver(
 async def create_receiver(
     receiver: receiver_schema.ReceiverCreate,
     session: AsyncSession = Depends(get_session),
-) -> receiver_schema.Receiver:
+) -> Receiver:
     """Create a new receiver."""
 
-    # Check if email already exists
-    query = select(Receiver).where(Receiver.email == receiver.email)
-    result = await session.exec(query)
-    existing_receiver = result.first()
-
-    if existing_receiver:
-        raise HTTPException(status_code=400, detail="Email already registered")
-
-    # Create new receiver
-    db_receiver = Receiver(**receiver.model_dump())
+    # Create new receiver, stamping both timestamps from one clock read
+    timestamp = now()
+    db_receiver = Receiver(
+        **receiver.model_dump(), created_at=timestamp, updated_at=timestamp
+    )
     session.add(db_receiver)
-    await session.commit()
-    await session.refresh(db_receiver)
+    # Duplicates are rejected by the unique index on email
+    await commit_or_raise(session, Receiver, RECEIVER_UNIQUE_ERRORS)
 
-    return receiver_schema.Receiver.model_validate(db_receiver)
+    return db_receiver
 
 
 @router.put(
@@ -92,53 +102,34 @@ async def create_receiver(
     description="Update an existing receiver with the provided details.",
     response_model=receiver_schema.Receiver,
 )
+@router.patch(
+    "/{receiver_id}",
+    name="patch_receiver",
+    summary="Partially update a receiver",
+    description="Partially update a receiver with the provided fields.",
+    response_model=receiver_schema.Receiver,
+)
 async def update_receiver(
     receiver_id: int,
     receiver_update: receiver_schema.ReceiverUpdate,
     session: AsyncSession = Depends(get_session),
-) -> receiver_schema.Receiver:
-    """Update an existing receiver."""
-    db_receiver = await session.get(Receiver, receiver_id)
+) -> Receiver:
+    """Update an existing receiver (PUT and PATCH share this handler)."""
+    db_receiver = await session.get(Receiver, receiver_id, options=SKIP_RELATIONSHIPS)
     if not db_receiver:
         raise HTTPException(status_code=404, detail="Receiver not found")
 
-    # Check if email is being updated and already exists
-    if receiver_update.email:
-        query = select(Receiver).where(
-            Receiver.email == receiver_update.email, Receiver.id != receiver_id
-        )
-        result = await session.exec(query)
-        existing_receiver = result.first()
-
-        if existing_receiver:
-            raise HTTPException(status_code=400, detail="Email already registered")
-
     # Update only provided fields
     update_data = receiver_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_receiver, field, value)  # Update timestamp
 
-    db_receiver.updated_at = datetime.now()
+    db_receiver.updated_at = now()
 
-    await session.commit()
-    await session.refresh(db_receiver)
-
-    return receiver_schema.Receiver.model_validate(db_receiver)
+    # Duplicates are rejected by the unique index on email
+    await commit_or_raise(session, Receiver, RECEIVER_UNIQUE_ERRORS)
 
-
-@router.patch(
-    "/{receiver_id}",
-    summary="Partially update a receiver",
-    description="Partially update a receiver with the provided fields.",
-    response_model=receiver_schema.Receiver,
-)
-async def patch_receiver(
-    receiver_id: int,
-    receiver_update: receiver_schema.ReceiverUpdate,
-    session: AsyncSession = Depends(get_session),
-) -> receiver_schema.Receiver:
-    """Partially update a receiver (same as PUT in this implementation)."""
-    return await update_receiver(receiver_id, receiver_update)
+    return db_receiver
 
 
 @router.delete(
@@ -151,12 +142,7 @@ async def delete_receiver(
     receiver_id: int, session: AsyncSession = Depends(get_session)
 ):
     """Delete a receiver."""
-    db_receiver = await session.get(Receiver, receiver_id)
-    if not db_receiver:
-        raise HTTPException(status_code=404, detail="Receiver not found")
-
-    await session.delete(db_receiver)
-    await session.commit()
+    await delete_referenced(session, Receiver, receiver_id, "Receiver not found")
     return None
 
 
@@ -168,20 +154,19 @@ async def delete_receiver(
 )
 async def activate_receiver(
     receiver_id: int, session: AsyncSession = Depends(get_session)
-) -> receiver_schema.Receiver:
+) -> Receiver:
     """Activate a receiver."""
-    db_receiver = await session.get(Receiver, receiver_id)
+    db_receiver = await session.get(Receiver, receiver_id, options=SKIP_RELATIONSHIPS)
     if not db_receiver:
         raise HTTPException(status_code=404, detail="Receiver not found")
 
     db_receiver.is_active = True
 
-    db_receiver.updated_at = datetime.now()
+    db_receiver.updated_at = now()
 
     await session.commit()
-    await session.refresh(db_receiver)
 
-    return receiver_schema.Receiver.model_validate(db_receiver)
+    return db_receiver
 
 
 @router.post(
@@ -192,17 +177,16 @@ async def activate_receiver(
 )
 async def deactivate_receiver(
     receiver_id: int, session: AsyncSession = Depends(get_session)
-) -> receiver_schema.Receiver:
+) -> Receiver:
     """Deactivate a receiver."""
-    db_receiver = await session.get(Receiver, receiver_id)
+    db_receiver = await session.get(Receiver, receiver_id, options=SKIP_RELATIONSHIPS)
     if not db_receiver:
         raise HTTPException(status_code=404, detail="Receiver not found")
 
     db_receiver.is_active = False
 
-    db_receiver.updated_at = datetime.now()
+    db_receiver.updated_at = now()
 
     await session.commit()
-    await session.refresh(db_receiver)
 
-    return receiver_schema.Receiver.model_validate(db_receiver)
\ No newline at end of file
+    return db_receiver
\ No newline at end of file
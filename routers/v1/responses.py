@@ -0,0 +1,46 @@
+from functools import cache
+from typing import Any, Iterable
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from sqlmodel import SQLModel
+
+# Upper bound on rows returned by a single list request
+MAX_PAGE_SIZE = 1000
+
+
+def schema_columns(model: type[SQLModel], schema: type[BaseModel]) -> list[Any]:
+    """Columns of ``model`` that ``schema`` reads.
+
+    Selecting these instead of the entity returns plain rows, which skip ORM
+    instance state and the identity map entirely.
+    """
+    return [getattr(model, name) for name in schema.model_fields]
+
+
+def construct(schema: type[BaseModel], row: Any) -> BaseModel:
+    """Build ``schema`` from a database row or entity without re-validating it.
+
+    Rows were validated on their way in, so reads copy the attributes over
+    with ``model_construct`` instead of paying for validation again.
+    """
+    return schema.model_construct(
+        **{name: getattr(row, name) for name in schema.model_fields}
+    )
+
+
+@cache
+def _list_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[schema])
+
+
+def json_response(schema: type[BaseModel], row: Any) -> Response:
+    """Encode a single database row as ``schema`` straight to JSON bytes."""
+    content = construct(schema, row).model_dump_json()
+    return Response(content=content, media_type="application/json")
+
+
+def json_list_response(schema: type[BaseModel], rows: Iterable[Any]) -> Response:
+    """Encode database rows as a JSON array of ``schema`` objects."""
+    content = _list_adapter(schema).dump_json([construct(schema, row) for row in rows])
+    return Response(content=content, media_type="application/json")
@@ -1,13 +1,34 @@
 from typing import Optional
-from fastapi import APIRouter, HTTPException, Depends
-from datetime import datetime
+from fastapi import Body, HTTPException, Depends, Query, Response
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from schemas import sender_schema
-from models import get_session, Sender
+from ...schemas import sender_schema
+from ...models import get_session, Sender
+from .crud import make_crud_router
+from .responses import MAX_PAGE_SIZE, json_list_response, schema_columns
+from .writes import commit_or_raise, now
+
+# 400 detail for a write that collides with each unique column
+SENDER_UNIQUE_ERRORS = {"email": "Email already registered"}
+
+router = make_crud_router(
+    prefix="/senders",
+    tag="senders",
+    label="sender",
+    id_param="sender_id",
+    model=Sender,
+    create_schema=sender_schema.SenderCreate,
+    update_schema=sender_schema.SenderUpdate,
+    read_schema=sender_schema.Sender,
+    unique_errors=SENDER_UNIQUE_ERRORS,
+)
+
+# Upper bound on senders created by a single bulk request
+MAX_BULK_SIZE = 1000
 
-router = APIRouter(prefix="/senders", tags=["senders"])
+# Read endpoints select these columns and get plain rows back
+SENDER_COLUMNS = schema_columns(Sender, sender_schema.Sender)
 
 
 @router.get(
@@ -17,126 +38,53 @@ router = APIRouter(prefix="/senders", tags=["senders"])
     response_model=list[sender_schema.Sender],
 )
 async def get_senders(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
     is_active: Optional[bool] = None,
     session: AsyncSession = Depends(get_session),
-) -> list[sender_schema.Sender]:
+) -> Response:
     """Get all senders with optional pagination and filtering."""
-    query = select(Sender)
+    query = select(*SENDER_COLUMNS)
 
     # Filter by is_active if provided
     if is_active is not None:
         query = query.where(Sender.is_active == is_active)
 
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
+    # Apply pagination in primary key order so pages are stable
+    query = query.order_by(Sender.id).offset(skip).limit(limit)
 
     result = await session.exec(query)
     senders = result.all()
 
-    return [sender_schema.Sender.model_validate(sender) for sender in senders]
-
-
-@router.get(
-    "/{sender_id}",
-    summary="Get a sender by ID",
-    description="Retrieve a specific sender using its unique identifier.",
-    response_model=sender_schema.Sender,
-)
-async def get_sender(
-    sender_id: int, session: AsyncSession = Depends(get_session)
-) -> sender_schema.Sender:
-    """Get a single sender by ID."""
-    sender = await session.get(Sender, sender_id)
-    if not sender:
-        raise HTTPException(status_code=404, detail="Sender not found")
-
-    return sender_schema.Sender.model_validate(sender)
+    return json_list_response(sender_schema.Sender, senders)
 
 
 @router.post(
-    "",
-    summary="Create a new sender",
-    description="Create a new sender with the provided details.",
-    response_model=sender_schema.Sender,
+    "/bulk",
+    summary="Create senders in bulk",
+    description="Create several senders in a single request and transaction.",
+    response_model=list[sender_schema.Sender],
     status_code=201,
 )
-async def create_sender(
-    sender: sender_schema.SenderCreate,
+async def create_senders_bulk(
+    senders: list[sender_schema.SenderCreate] = Body(
+        min_length=1, max_length=MAX_BULK_SIZE
+    ),
     session: AsyncSession = Depends(get_session),
-) -> sender_schema.Sender:
-    """Create a new sender."""
-    # Check if email already exists
-    query = select(Sender).where(Sender.email == sender.email)
-    result = await session.exec(query)
-    existing_sender = result.first()
-
-    if existing_sender:
-        raise HTTPException(status_code=400, detail="Email already registered")
-
-    # Create new sender
-    db_sender = Sender(**sender.model_dump())
-    session.add(db_sender)
-    await session.commit()
-    await session.refresh(db_sender)
-
-    return sender_schema.Sender.model_validate(db_sender)
-
-
-@router.put(
-    "/{sender_id}",
-    summary="Update an existing sender",
-    description="Update an existing sender with the provided details.",
-    response_model=sender_schema.Sender,
-)
-async def update_sender(
-    sender_id: int,
-    sender_update: sender_schema.SenderUpdate,
-    session: AsyncSession = Depends(get_session),
-) -> sender_schema.Sender:
-    """Update an existing sender."""
-    db_sender = await session.get(Sender, sender_id)
-    if not db_sender:
-        raise HTTPException(status_code=404, detail="Sender not found")
-
-    # Check if email is being updated and already exists
-    if sender_update.email:
-        query = select(Sender).where(
-            Sender.email == sender_update.email, Sender.id != sender_id
-        )
-        result = await session.exec(query)
-        existing_sender = result.first()
-
-        if existing_sender:
-            raise HTTPException(status_code=400, detail="Email already registered")
-
-    # Update only provided fields
-    update_data = sender_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_sender, field, value)
-
-    # Update timestamp
-    db_sender.updated_at = datetime.now()
-
-    await session.commit()
-    await session.refresh(db_sender)
-
-    return sender_schema.Sender.model_validate(db_sender)
-
-
-@router.delete(
-    "/{sender_id}",
-    summary="Delete a sender",
-    description="Delete a sender by ID.",
-    status_code=204,
-)
-async def delete_sender(sender_id: int, session: AsyncSession = Depends(get_session)):
-    """Delete a sender."""
-    db_sender = await session.get(Sender, sender_id)
-    if not db_sender:
-        raise HTTPException(status_code=404, detail="Sender not found")
-
-    await session.delete(db_sender)
-    await session.commit()
-    return None
\ No newline at end of file
+) -> list[Sender]:
+    """Create several senders at once; either all are created or none."""
+    # Reject duplicates inside the batch before touching the database
+    if len({sender.email for sender in senders}) != len(senders):
+        raise HTTPException(status_code=400, detail="Duplicate email in request")
+
+    # The whole batch shares one creation timestamp
+    timestamp = now()
+    db_senders = [
+        Sender(**sender.model_dump(), created_at=timestamp, updated_at=timestamp)
+        for sender in senders
+    ]
+    session.add_all(db_senders)
+    # Collisions with existing rows are rejected by the unique index on email
+    await commit_or_raise(session, Sender, SENDER_UNIQUE_ERRORS)
+
+    return db_senders
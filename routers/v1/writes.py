@@ -0,0 +1,90 @@
+from datetime import datetime
+from typing import Mapping, Optional
+
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import SQLModel, delete
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+# Write handlers stamp timestamps through this module-level binding, which
+# skips the attribute lookup on datetime for every call
+now = datetime.now
+
+
+def unique_violation(model: type[SQLModel], column: str) -> str:
+    """SQLite's error message for a collision on ``model``'s unique ``column``."""
+    return f"UNIQUE constraint failed: {model.__tablename__}.{column}"
+
+
+def raise_for_constraint(
+    exc: IntegrityError,
+    model: type[SQLModel],
+    unique_errors: Optional[Mapping[str, str]] = None,
+) -> None:
+    """Raise the client error for a constraint failure we know how to report.
+
+    A collision on a column in ``unique_errors`` becomes a 400 with that
+    column's detail and a NOT NULL failure becomes a 422. Returns without
+    raising for anything else, so the caller can re-raise ``exc``.
+    """
+    message = str(exc.orig)
+    for column, detail in (unique_errors or {}).items():
+        if message == unique_violation(model, column):
+            raise HTTPException(status_code=400, detail=detail) from exc
+
+    if message.startswith("NOT NULL constraint failed: "):
+        column = message.rsplit(".", 1)[-1]
+        raise HTTPException(status_code=422, detail=f"{column} may not be null") from exc
+
+
+async def commit_or_raise(
+    session: AsyncSession,
+    model: type[SQLModel],
+    unique_errors: Optional[Mapping[str, str]] = None,
+) -> None:
+    """Commit ``session``, reporting known constraint failures as client errors."""
+    try:
+        await session.commit()
+    except IntegrityError as exc:
+        await session.rollback()
+        raise_for_constraint(exc, model, unique_errors)
+        raise
+
+
+async def delete_or_raise(
+    session: AsyncSession, model: type[SQLModel], object_id: int, not_found: str
+) -> None:
+    """Delete ``model``'s row ``object_id`` with a single DELETE statement.
+
+    The statement's rowcount tells us whether the row existed, so there is
+    no SELECT first. Only for tables no other rows point at: the statement
+    bypasses the ORM, which would otherwise clear those references.
+    """
+    result = await session.exec(delete(model).where(model.id == object_id))
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail=not_found)
+
+    await session.commit()
+
+
+async def delete_referenced(
+    session: AsyncSession, model: type[SQLModel], object_id: int, not_found: str
+) -> None:
+    """Delete ``model``'s row ``object_id`` through the ORM.
+
+    For tables other rows point at: loading the entity first lets the ORM
+    clear the references to it before the DELETE. A row that a required
+    reference still points at can't be cleared and is refused with a 409.
+    """
+    db_object = await session.get(model, object_id)
+    if not db_object:
+        raise HTTPException(status_code=404, detail=not_found)
+
+    await session.delete(db_object)
+    try:
+        await session.commit()
+    except IntegrityError as exc:
+        await session.rollback()
+        raise HTTPException(
+            status_code=409, detail="Still referenced by other records"
+        ) from exc